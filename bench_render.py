@@ -0,0 +1,64 @@
+# bench_render.py
+# Сравнение скорости вывода карточек: pandas (PlayRound.print_cards) и CardRenderer
+
+import io
+import random
+import time
+from contextlib import redirect_stdout
+from lotto import Player, PlayRound
+from render import CardRenderer
+from constants import MAX_PLAYERS, NUMBERS_IN_CARD
+
+MOVES = NUMBERS_IN_CARD - 1        # Ходов в одной партии (без победного)
+REPEAT = 5                         # Число повторов замера
+
+
+def make_round(renderer=None):
+    """
+    Создаёт раунд из MAX_PLAYERS роботов с новыми карточками.
+    """
+    with redirect_stdout(io.StringIO()):
+        players = [Player(name=f"Робот{i}", is_human=False) for i in range(1, MAX_PLAYERS + 1)]
+    return PlayRound(*players, renderer=renderer)
+
+
+def play_frames(play_round, out):
+    """
+    Каждый ход зачёркивает по одному числу у каждого игрока и выводит карточки.
+
+    :return: Кортеж из времени отрисовки всех кадров (с) и числа выведенных символов.
+    """
+    # Ходы выбираются заранее, чтобы в замер попала только отрисовка
+    moves = []
+    for player in play_round.players:
+        row_idx, col_idx = (player.card.df.to_numpy() > 0).nonzero()
+        cells = random.sample(list(zip(row_idx.tolist(), col_idx.tolist())), MOVES)
+        moves.append(cells)
+    start = time.perf_counter()
+    with redirect_stdout(out):
+        for move in range(MOVES):
+            for player, cells in zip(play_round.players, moves):
+                row_idx, col_idx = cells[move]
+                player.moves['row'].append(row_idx)
+                player.moves['col'].append(col_idx)
+            play_round.print_cards()
+    return time.perf_counter() - start, out.tell()
+
+
+def bench(name, make_renderer):
+    """
+    Замеряет время кадра и объём вывода за партию (лучший из REPEAT замеров).
+    """
+    runs = []
+    for _ in range(REPEAT):
+        out = io.StringIO()
+        runs.append(play_frames(make_round(make_renderer(out)), out))
+    best, size = min(runs)
+    print(f'{name:<28} {best / MOVES * 1000:8.3f} мс/кадр {size / MOVES:10.0f} символов/кадр')
+
+
+if __name__ == "__main__":
+    print(f'{MAX_PLAYERS} игроков, {MOVES} ходов, лучший из {REPEAT} замеров')
+    bench('pandas (print_cards)', lambda out: None)
+    bench('CardRenderer, полный кадр', lambda out: CardRenderer(stream=out))
+    bench('CardRenderer, ANSI-разница', lambda out: CardRenderer(stream=out, ansi=True))
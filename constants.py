@@ -19,3 +19,6 @@ CROSS = -1                        # Обозначение зачёркнуто
 CROSS_STR = '-'                   # Знак для печати
 MISTAKE_RATE = 0.01                # Процент ошибок робота
 NUMBERS_IN_CARD = CARD_ROWS * NUMBERS_PER_ROW # Чисел в карточке
+MIN_PLAYERS = 2                    # Минимум игроков за столом
+MAX_PLAYERS = 5                    # Максимум игроков за столом
+DRAW_REPLAYS = 1                   # Сколько раз переигрывается стол при ничьей
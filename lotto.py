@@ -6,16 +6,18 @@ import numpy as np
 import pandas as pd
 from constants import (
     GameStatus, LOTTO_NUM, NUMBER_RANGE, CARD_ROWS, CARD_COLS,
-    NUMBERS_PER_ROW, NUMBERS_IN_CARD, BLANK, CROSS, CROSS_STR, MISTAKE_RATE
+    NUMBERS_PER_ROW, NUMBERS_IN_CARD, BLANK, CROSS, CROSS_STR, MISTAKE_RATE,
+    MIN_PLAYERS, MAX_PLAYERS
 )
 
 class LottoCard:
     
-    def __init__(self, numbers=None):
+    def __init__(self, numbers=None, quiet: bool = False):
         """
         Инициализирует карточку лото.
         
         :param numbers: Список чисел для карточки. Если None, используется диапазон от 1 до LOTTO_NUM.
+        :param quiet: Не печатать сгенерированную карточку.
         """
         if numbers is None:
             self.numbers = NUMBER_RANGE.copy()
@@ -27,6 +29,7 @@ class LottoCard:
             if not all(num in NUMBER_RANGE for num in numbers):
                 raise ValueError(f"Все числа должны быть в диапазоне от {NUMBER_RANGE[0]} до {NUMBER_RANGE[-1]}.")
             self.numbers = numbers.copy()
+        self.quiet = quiet
         self.card = self._create_card()
     
     @property
@@ -52,7 +55,8 @@ class LottoCard:
         
         # Создаём DataFrame с типом данных object
         card = pd.DataFrame(card_rows)
-        print('Сгенерил карту:\n', card)
+        if not self.quiet:
+            print('Сгенерил карту:\n', card)
         return card
 
 class Player:
@@ -72,6 +76,16 @@ class Player:
         self.moves = {'row': [], 'col': []}
         self.mistake_rate = mistake_rate  # Добавляем атрибут mistake_rate
 
+    def new_card(self, card: 'LottoCard' = None, quiet: bool = False):
+        """
+        Выдаёт игроку новую карточку и сбрасывает список ходов (перед следующим раундом).
+        
+        :param card: Объект LottoCard. Если None, создаётся новая карточка.
+        :param quiet: Не печатать новую карточку.
+        """
+        self.card = card if card else LottoCard(quiet=quiet)
+        self.moves = {'row': [], 'col': []}
+
     def check_barrel(self, barrel):
         """
         Проверяет наличие номера бочонка на карточке.
@@ -87,18 +101,20 @@ class Player:
             # Если нет, возвращаем 2 х None
             return None, None
 
-    def update_moves_list(self, row_idx, col_idx, barrel):
+    def update_moves_list(self, row_idx, col_idx, barrel, quiet: bool = False):
         """
         Обновляет список ходов игрока и заменяет число на CROSS.
         
         :param row_idx: Индекс строки.
         :param col_idx: Индекс колонки.
         :param barrel: Номер бочонка.
+        :param quiet: Не печатать сообщение о ходе.
         :return: Статус игры.
         """
         self.moves['row'].append(row_idx)
         self.moves['col'].append(col_idx)
-        print(f'Игрок {self.name} вычеркнул бочонок {barrel} на строке {row_idx} в столбце {col_idx}')
+        if not quiet:
+            print(f'Игрок {self.name} вычеркнул бочонок {barrel} на строке {row_idx} в столбце {col_idx}')
         # Заменяем число на CROSS в карточке
         self.card.df.iat[row_idx, col_idx] = CROSS
 
@@ -108,12 +124,13 @@ class Player:
         else:
             return GameStatus.WIN
 
-    def check_move(self, strike_out, barrel):
+    def check_move(self, strike_out, barrel, quiet: bool = False):
         """
         Проверяет ход игрока.
         
         :param strike_out: Команда вычеркнуть число (True/False).
         :param barrel: Номер бочонка.
+        :param quiet: Не печатать сообщения о ходе и ошибке.
         :return: Статус игры.
         """
         row_idx, col_idx = self.check_barrel(barrel)
@@ -130,17 +147,18 @@ class Player:
 
         if barrel_on_card and strike_out:
             # Если цифра нашлась и команда "Вычеркнуть", то верный ход
-            return self.update_moves_list(row_idx, col_idx, barrel)
+            return self.update_moves_list(row_idx, col_idx, barrel, quiet)
         elif not barrel_on_card and not strike_out:
             # Верный пропуск хода
             return GameStatus.NEXT_MOVE
         else:
             # Ошибка: зря вычеркнул или не заметил
-            print(f'{self.name} ошибся')
-            if barrel_on_card:
-                print('Не заметил номера бочонка в своей карточке')
-            else:
-                print('Попытался вычеркнуть номер, которого нет в карточке')                
+            if not quiet:
+                print(f'{self.name} ошибся')
+                if barrel_on_card:
+                    print('Не заметил номера бочонка в своей карточке')
+                else:
+                    print('Попытался вычеркнуть номер, которого нет в карточке')
             return GameStatus.LOOSE   
 
     def show_card(self):
@@ -154,9 +172,10 @@ class Player:
         row_idx = self.moves['row']
         col_idx = self.moves['col']
 
-        # Если список индексов непустой, произведем замену цифр на прочерки
-        if row_idx and col_idx:
-            df_str.values[row_idx, col_idx] = CROSS_STR
+        # Заменяем вычеркнутые цифры на прочерки. Через .iat: в pandas 3 запись
+        # в .values не доходит до самой таблицы
+        for row, col in zip(row_idx, col_idx):
+            df_str.iat[row, col] = CROSS_STR
 
         # Возвращаем актуализированную таблицу
         return df_str
@@ -177,31 +196,44 @@ class Lotto:
 
 class PlayRound:
 
-    def __init__(self, *players: 'Player'):
+    def __init__(self, *players: 'Player', renderer=None, quiet: bool = False):
         """
         Инициализирует игровой раунд.
         
         :param players: Игроки участвующие в раунде.
+        :param renderer: Объект CardRenderer для вывода карточек. Если None, карточки печатаются через pandas.
+        :param quiet: Играть молча: без журнала ходов и без вывода карточек.
         """
-        if not (2 <= len(players) <= 5):
-            raise ValueError("Количество игроков должно быть от 2 до 5.")
+        if not (MIN_PLAYERS <= len(players) <= MAX_PLAYERS):
+            raise ValueError(f"Количество игроков должно быть от {MIN_PLAYERS} до {MAX_PLAYERS}.")
         self.players = list(players)  # Преобразуем кортеж в список для удобства
         self.lotto = Lotto()
         self.move_num = 0
+        self.renderer = renderer
+        self.quiet = quiet
+
+    def _log(self, *args):
+        """
+        Печатает сообщение журнала раунда, если раунд играется не молча.
+        """
+        if not self.quiet:
+            print(*args)
 
     def run_play_round(self):
         """
         Запускает один раунд игры со списком игроков.
+        
+        :return: Победитель раунда (Player) или None в случае ничьей.
         """
         players_list = ', '.join([f"{player.name} ({'Человек' if player.is_human else 'Робот'})" for player in self.players])
-        print(f"Начало игрового раунда! Игроки: {players_list}")
-        print('Карточки игроков:')
+        self._log(f"Начало игрового раунда! Игроки: {players_list}")
+        self._log('Карточки игроков:')
         self.print_cards()
         
         # Цикл игры
         while (barrel := self.lotto.draw()):
             self.move_num += 1
-            print(f"Ход {self.move_num}: Выбран бочонок: {barrel}")
+            self._log(f"Ход {self.move_num}: Выбран бочонок: {barrel}")
 
             # Ходы всех игроков
             for player in self.players.copy():  # Используем копию списка для безопасного удаления
@@ -212,35 +244,42 @@ class PlayRound:
                     # Робот принимает решение автоматически внутри метода check_move
                     strike_out = None
 
-                status = player.check_move(strike_out, barrel)
+                status = player.check_move(strike_out, barrel, quiet=self.quiet)
                 
                 if status == GameStatus.WIN:
                     self.print_cards()
-                    print(f'Поздравляю! {player.name} выиграл(а)!')
-                    return
+                    self._log(f'Поздравляю! {player.name} выиграл(а)!')
+                    return player
                 elif status == GameStatus.LOOSE:
-                    print(f'Игрок {player.name} проиграл(а) и выбывает из игры!')
+                    self._log(f'Игрок {player.name} проиграл(а) и выбывает из игры!')
                     self.players.remove(player)
 
                     if len(self.players) >= 2:
                         continue
                     if len(self.players) == 1: 
-                        print(f'Остался один игрок {self.players[0].name}. Победа присуждается ему')
-                        return
+                        self._log(f'Остался один игрок {self.players[0].name}. Победа присуждается ему')
+                        return self.players[0]
                     else:
-                        print('Ни одного игрока не осталось. Ничья')
-                        return                    
+                        self._log('Ни одного игрока не осталось. Ничья')
+                        return None
                     
             # Печать текущего статуса карточек
             self.print_cards()        
 
         else:
-            print('Все бочонки кончились! Ничья')
+            self._log('Все бочонки кончились! Ничья')
+            return None
 
     def print_cards(self):
         """
         Печатает карточки всех игроков в один ряд.
         """
+        if self.quiet:
+            return
+        if self.renderer is not None:
+            self.renderer.render(self.players)
+            return
+
         headers = [f"{player.name} (Зачеркнуто: {len(player.moves['row'])})" for player in self.players]
         df_cards = [player.show_card() for player in self.players]
 
@@ -273,6 +312,8 @@ class PlayRound:
 
 # Пример использования
 if __name__ == "__main__":
+    import sys
+    from render import CardRenderer
 
     # Создаем игроков с разными карточками (можно передать список чисел при необходимости)
     player1 = Player(name="Лев", is_human=True)
@@ -280,7 +321,9 @@ if __name__ == "__main__":
     player3 = Player(name="Виктор", is_human=False)
     player4 = Player(name="Алиса", is_human=False)
 
-    # Создаем игровой раунд с четырьмя игроками
-    game_round = PlayRound(player1, player2, player3, player4)
-    game_round.run_play_round()
+    # Создаем игровой раунд с четырьмя игроками.
+    # В терминале карточки закрепляются вверху экрана и перерисовываются только изменения
+    with CardRenderer(ansi=sys.stdout.isatty()) as renderer:
+        game_round = PlayRound(player1, player2, player3, player4, renderer=renderer)
+        game_round.run_play_round()
     print(f'Спасибо! Игра закончена на {game_round.move_num} ходу')
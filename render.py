@@ -0,0 +1,209 @@
+# render.py
+# Быстрая текстовая отрисовка карточек игроков без pandas
+
+import shutil
+import sys
+from constants import LOTTO_NUM, CARD_ROWS, CARD_COLS, NUMBERS_IN_CARD, BLANK, CROSS, CROSS_STR
+
+SEPARATOR = ' | '                  # Разделитель между карточками
+CELL_WIDTH = 3                     # Ширина ячейки карточки в символах
+
+
+class _CardLayout:
+    """
+    Заготовка карточки одного игрока: строки ячеек фиксированной ширины.
+    """
+
+    def __init__(self, player, cells, cross_cell):
+        self.card = player.card
+        values = player.card.df.to_numpy()
+        self.cells = [
+            [cross_cell if value == CROSS else cells[value] for value in row]
+            for row in values.tolist()
+        ]
+        self.rows = [''.join(row) for row in self.cells]
+        self.seen = len(player.moves['row'])  # Сколько ходов игрока уже отрисовано
+        self.x = 0                            # Смещение карточки в строке кадра
+        self.y = 0                            # Строка заголовка карточки в кадре
+
+
+class CardRenderer:
+
+    def __init__(self, stream=None, ansi: bool = False, cell_width: int = CELL_WIDTH,
+                 size: tuple = None):
+        """
+        Инициализирует отрисовщик карточек.
+
+        :param stream: Поток вывода. Если None, используется sys.stdout.
+        :param ansi: Режим терминала: карточки закрепляются вверху экрана,
+                     а при следующих ходах перерисовываются только новые зачёркнутые ячейки.
+        :param cell_width: Ширина ячейки в символах.
+        :param size: Размер терминала (колонки, строки). Если None, определяется при каждом выводе.
+        """
+        self.stream = stream
+        self.ansi = ansi
+        self.size = size
+        self.cell_width = cell_width
+        self.card_width = CARD_COLS * cell_width
+        # Все возможные ячейки форматируются один раз
+        self._cells = [f'{num:>{cell_width}}' for num in range(LOTTO_NUM + 1)]
+        self._cells[BLANK] = ' ' * cell_width
+        self._cross_cell = f'{CROSS_STR:>{cell_width}}'
+        self._layouts = {}
+        self._frame_key = None   # (игроки, их карточки, размер терминала) закреплённого кадра
+        self._height = 0         # Число закреплённых строк вверху экрана
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _layout(self, player):
+        """
+        Возвращает заготовку карточки игрока, создавая её для новой карточки.
+        """
+        layout = self._layouts.get(player)
+        if layout is None or layout.card is not player.card:
+            layout = self._layouts[player] = _CardLayout(player, self._cells, self._cross_cell)
+        return layout
+
+    def _size(self):
+        return self.size or tuple(shutil.get_terminal_size())
+
+    def _per_band(self, width):
+        """
+        Возвращает число карточек, помещающихся в одну полосу кадра шириной width.
+        """
+        return max(1, (width + len(SEPARATOR)) // (self.card_width + len(SEPARATOR)))
+
+    def _header(self, player):
+        text = f"{player.name} ({len(player.moves['row'])}/{NUMBERS_IN_CARD})"
+        return f'{text:<{self.card_width}.{self.card_width}}'
+
+    def _cross_new(self, player, layout):
+        """
+        Зачёркивает в заготовке ячейки, вычеркнутые игроком после прошлого кадра.
+
+        :return: Список координат (строка, колонка) новых зачёркнутых ячеек.
+        """
+        rows, cols = player.moves['row'], player.moves['col']
+        crossed = list(zip(rows[layout.seen:], cols[layout.seen:]))
+        for row_idx, col_idx in crossed:
+            layout.cells[row_idx][col_idx] = self._cross_cell
+        for row_idx in {row_idx for row_idx, _ in crossed}:
+            layout.rows[row_idx] = ''.join(layout.cells[row_idx])
+        layout.seen = len(rows)
+        return crossed
+
+    def frame(self, players, width: int = None):
+        """
+        Собирает полный кадр: карточки игроков в ряд, с переносом в новые полосы по ширине.
+
+        :param players: Список игроков.
+        :param width: Ширина кадра. Если None, берётся ширина терминала.
+        :return: Текст кадра (строки без завершающего перевода строки).
+        """
+        per_band = self._per_band(width or self._size()[0])
+        layouts = [self._layout(player) for player in players]
+        # Забываем выбывших игроков, чтобы не держать их карточки между раундами
+        self._layouts = dict(zip(players, layouts))
+        lines = []
+        for start in range(0, len(players), per_band):
+            band = list(zip(players[start:start + per_band], layouts[start:start + per_band]))
+            for i, (player, layout) in enumerate(band):
+                self._cross_new(player, layout)
+                layout.x = i * (self.card_width + len(SEPARATOR))
+                layout.y = len(lines)
+            lines.append(SEPARATOR.join(self._header(player) for player, _ in band))
+            lines += [SEPARATOR.join(layout.rows[row_idx] for _, layout in band) for row_idx in range(CARD_ROWS)]
+        return '\n'.join(lines)
+
+    def diff(self, players):
+        """
+        Собирает ANSI-последовательность, перерисовывающую только изменившиеся ячейки и заголовки.
+
+        :param players: Те же игроки, что и в прошлом кадре.
+        :return: Строка с командами позиционирования курсора (пустая, если изменений нет).
+        """
+        parts = []
+        for player in players:
+            layout = self._layout(player)
+            crossed = self._cross_new(player, layout)
+            if not crossed:
+                continue
+            # Строки терминала нумеруются с 1: заголовок полосы, под ним строки карточки
+            parts.append(f'\x1b[{layout.y + 1};{layout.x + 1}H{self._header(player)}')
+            for row_idx, col_idx in crossed:
+                parts.append(f'\x1b[{layout.y + row_idx + 2};{layout.x + col_idx * self.cell_width + 1}H{self._cross_cell}')
+        if not parts:
+            return ''
+        # Сохраняем и восстанавливаем курсор, чтобы не сбить вывод игры
+        return '\x1b7' + ''.join(parts) + '\x1b8'
+
+    def _pin(self, lines):
+        """
+        Собирает ANSI-последовательность, закрепляющую кадр вверху экрана.
+
+        Экран не очищается: если закреплённых строк не хватает, весь экран сдвигается вниз
+        вставкой строк, а уже выведенный журнал игры остаётся под кадром.
+
+        :param lines: Строки кадра.
+        :return: Строка с командами терминала.
+        """
+        grow = max(len(lines) - self._height, 0)
+        parts = []
+        if grow:
+            # Освобождаем grow строк под курсором, чтобы вставка не вытолкнула журнал за экран
+            parts.append('\n' * grow + f'\x1b[{grow}A')
+        parts.append('\x1b7\x1b[r')
+        if grow:
+            parts.append(f'\x1b[H\x1b[{grow}L')
+        self._height += grow
+        for i in range(self._height):
+            # Лишние закреплённые строки (после выбывания игроков) очищаются
+            parts.append(f'\x1b[{i + 1};1H\x1b[2K{lines[i] if i < len(lines) else ""}')
+        parts.append(f'\x1b[{self._height + 1}r\x1b8')
+        if grow:
+            parts.append(f'\x1b[{grow}B')
+        return ''.join(parts)
+
+    def render(self, players):
+        """
+        Выводит карточки игроков: целиком или, в режиме ANSI, только изменения с прошлого кадра.
+
+        Если кадр не помещается в терминал по ширине или высоте, режим ANSI выводит полные кадры.
+
+        :param players: Список игроков.
+        """
+        stream = self.stream or sys.stdout
+        players = tuple(players)
+        columns, rows = self._size()
+        # Новые карточки тех же игроков (переигровка, следующий раунд) и изменение размера
+        # терминала требуют полного кадра
+        key = (players, tuple(player.card for player in players), columns, rows)
+        if not self.ansi:
+            stream.write(self.frame(players, columns) + '\n')
+        elif key == self._frame_key:
+            stream.write(self.diff(players))
+        else:
+            lines = self.frame(players, columns).split('\n')
+            if self.card_width > columns or len(lines) >= rows:
+                # Строки кадра переносились бы, и адресация курсора попадала бы мимо ячеек
+                self.close()
+                stream.write('\n'.join(lines) + '\n')
+            else:
+                stream.write(self._pin(lines))
+                self._frame_key = key
+        stream.flush()
+
+    def close(self):
+        """
+        Снимает ограничение прокрутки, установленное в режиме ANSI.
+        """
+        if self._height:
+            stream = self.stream or sys.stdout
+            stream.write('\x1b7\x1b[r\x1b8')
+            stream.flush()
+        self._height = 0
+        self._frame_key = None
@@ -6,7 +6,7 @@ import numpy as np
 import pandas as pd
 from lotto import LottoCard, Player, Lotto, PlayRound
 from constants import GameStatus, MISTAKE_RATE, BLANK, CROSS, NUMBERS_IN_CARD, LOTTO_NUM,\
-                                CARD_ROWS,CARD_COLS,NUMBERS_PER_ROW
+                                CARD_ROWS,CARD_COLS,NUMBERS_PER_ROW,CROSS_STR
 
 
 def create_lotto_card(numbers, card_rows=CARD_ROWS, card_cols=CARD_COLS, numbers_per_row=NUMBERS_PER_ROW, blank=BLANK):
@@ -209,6 +209,16 @@ def test_player_check_move_win(predefined_card):
     status = player.check_move(True, 15)
     assert status == GameStatus.WIN, "Статус должен быть WIN после зачёркивания последнего числа"
 
+# Тестирование вывода карточки с вычеркнутыми числами
+def test_player_show_card(predefined_card):
+    card, fixed_numbers = predefined_card
+    player = Player(name="Тестовый игрок", is_human=True, card=card, mistake_rate=MISTAKE_RATE)
+    player.check_move(True, 7)  # строка 1, колонка 1
+    df_str = player.show_card()
+    assert df_str.iat[1, 1] == CROSS_STR, "Вычеркнутое число должно печататься прочерком"
+    assert df_str.iat[0, 0] == '1'
+    assert df_str.iat[0, CARD_COLS - 1] == '', "Пустая ячейка печатается пустой строкой"
+
 # Тестирование метода draw в классе Lotto
 def test_lotto_draw():
     total_numbers = NUMBERS_IN_CARD
@@ -233,9 +243,10 @@ def test_play_round_robot_win(predefined_players):
     # Мокаем последовательность бочонков, включающую все 15 чисел робота1
     with patch.object(Lotto, 'draw', side_effect=list(range(1, NUMBERS_IN_CARD +1 )) + [None]):
         with patch('builtins.print') as mocked_print:
-            play_round.run_play_round()
+            winner = play_round.run_play_round()
             # Проверяем, что робот1 выиграл
             mocked_print.assert_any_call(f'Поздравляю! {player1.name} выиграл(а)!')
+    assert winner is player1, "run_play_round должен вернуть победителя"
 
     # Дополнительные проверки:
     # Проверяем, что у робота1 все числа вычеркнуты
@@ -266,11 +277,12 @@ def test_play_round_robot_lose(predefined_players):
             GameStatus.NEXT_MOVE,  # Дополнительный вызов draw()
         ]):
             with patch('builtins.print') as mocked_print:
-                play_round.run_play_round()
+                winner = play_round.run_play_round()
                 # Проверяем, что робот2 проиграл
                 mocked_print.assert_any_call(f'Игрок {player2.name} проиграл(а) и выбывает из игры!')
                 # Проверяем, что робот1 выиграл
                 mocked_print.assert_any_call(f'Остался один игрок {player1.name}. Победа присуждается ему')
+    assert winner is player1, "Победа присуждается последнему оставшемуся игроку"
 
 # Тестирование игрового раунда с ничьёй
 def test_play_round_draw(predefined_players):
@@ -284,8 +296,27 @@ def test_play_round_draw(predefined_players):
     with patch.object(Lotto, 'draw', side_effect=[91, 92, 93, None]):
         with patch.object(Player, 'check_move', return_value=GameStatus.NEXT_MOVE):
             with patch('builtins.print') as mocked_print:
-                play_round.run_play_round()
+                winner = play_round.run_play_round()
                 mocked_print.assert_any_call('Все бочонки кончились! Ничья')
+    assert winner is None, "При ничьей победителя нет"
+
+# Тестирование игрового раунда, где ошибаются все игроки
+def test_play_round_all_players_mistake(predefined_players):
+    """
+    Тестирует, что при ошибке всех игроков на одном ходу победа присуждается последнему
+    оставшемуся: раунд заканчивается раньше, чем выбудут все.
+    """
+    player1, player2 = predefined_players
+    player3 = Player(name="Робот3", is_human=False, card=player1.card)
+    play_round = PlayRound(player1, player2, player3)
+
+    with patch.object(Lotto, 'draw', side_effect=[1, None]):
+        with patch.object(Player, 'check_move', return_value=GameStatus.LOOSE):
+            with patch('builtins.print') as mocked_print:
+                winner = play_round.run_play_round()
+                mocked_print.assert_any_call(f'Остался один игрок {player3.name}. Победа присуждается ему')
+    assert winner is player3, "Победа присуждается последнему оставшемуся игроку"
+    assert play_round.players == [player3]
 
 # Тестирование игрового раунда с победой человека
 def test_play_round_human_player_win(predefined_card, predefined_card_robot):
@@ -0,0 +1,237 @@
+# test_render.py
+
+import io
+import re
+import pytest
+from unittest.mock import patch
+import pandas as pd
+from lotto import LottoCard, Player, PlayRound
+from render import CardRenderer, SEPARATOR, CELL_WIDTH
+from constants import BLANK, CARD_ROWS, CARD_COLS, CROSS_STR, NUMBERS_IN_CARD
+
+
+def make_player(name, numbers):
+    """
+    Создаёт робота с карточкой, в которой числа занимают первые 5 колонок каждой строки.
+    """
+    with patch.object(LottoCard, '__init__', lambda self: None):
+        card = LottoCard()
+        card.df = pd.DataFrame([numbers[i:i + 5] + [BLANK] * 4 for i in range(0, 15, 5)])
+    # Робот без ошибок: тесты проверяют вывод, а не случайные промахи
+    return Player(name=name, is_human=False, card=card, mistake_rate=0)
+
+# Фикстура для создания двух игроков с фиксированными карточками
+@pytest.fixture
+def players():
+    return make_player("Боб", list(range(1, 16))), make_player("Алиса", list(range(76, 91)))
+
+def cell(line, x, col_idx):
+    start = x + col_idx * CELL_WIDTH
+    return line[start:start + CELL_WIDTH]
+
+# Тестирование полного кадра
+def test_frame_layout(players):
+    """
+    Проверяет, что карточки выводятся в один ряд ячейками фиксированной ширины.
+    """
+    frame = CardRenderer().frame(players, 80).split('\n')
+    card_width = CARD_COLS * CELL_WIDTH
+    second_x = card_width + len(SEPARATOR)
+
+    assert len(frame) == CARD_ROWS + 1, "Заголовок и строки карточки"
+    assert all(len(line) == 2 * card_width + len(SEPARATOR) for line in frame)
+    assert frame[0].startswith(f"Боб (0/{NUMBERS_IN_CARD})")
+    assert frame[0][second_x:].startswith(f"Алиса (0/{NUMBERS_IN_CARD})")
+    assert cell(frame[1], 0, 0) == '  1'
+    assert cell(frame[3], second_x, 4) == ' 90'
+    assert cell(frame[2], 0, CARD_COLS - 1) == ' ' * CELL_WIDTH, "Пустая ячейка"
+
+# Тестирование совпадения с выводом pandas
+def test_frame_matches_show_card(players):
+    """
+    Проверяет, что ячейки кадра совпадают с Player.show_card после вычёркиваний.
+    """
+    player1, player2 = players
+    with patch('builtins.print'):
+        player1.check_move(None, 7)
+        player2.check_move(None, 76)
+    frame = CardRenderer().frame(players, 80).split('\n')
+
+    x = 0
+    for player in players:
+        expected = player.show_card()
+        for row_idx in range(CARD_ROWS):
+            for col_idx in range(CARD_COLS):
+                assert cell(frame[row_idx + 1], x, col_idx).strip() == expected.iat[row_idx, col_idx]
+        x += CARD_COLS * CELL_WIDTH + len(SEPARATOR)
+    assert frame[0].startswith(f"Боб (1/{NUMBERS_IN_CARD})")
+
+# Тестирование ANSI-режима
+def test_ansi_diff_only(players):
+    """
+    Проверяет, что в режиме ANSI после первого кадра выводятся только новые зачёркнутые ячейки.
+    """
+    player1, player2 = players
+    out = io.StringIO()
+    renderer = CardRenderer(stream=out, ansi=True, size=(120, 40))
+    height = CARD_ROWS + 1
+
+    renderer.render(players)
+    first = out.getvalue()
+    assert '\x1b[2J' not in first, "Экран не очищается, журнал игры сохраняется"
+    assert first.startswith('\n' * height + f'\x1b[{height}A'), "Под курсором освобождаются строки для кадра"
+    assert f'\x1b[H\x1b[{height}L' in first, "Экран сдвигается вниз вставкой строк"
+    assert f'\x1b[{height + 1}r' in first, "Прокрутка ограничена строками под кадром"
+
+    # Без изменений ничего не выводится
+    renderer.render(players)
+    assert out.getvalue() == first
+
+    with patch('builtins.print'):
+        player2.check_move(None, 82)  # строка 1, колонка 1
+    renderer.render(players)
+    update = out.getvalue()[len(first):]
+    second_x = CARD_COLS * CELL_WIDTH + len(SEPARATOR)
+    assert update.startswith('\x1b7') and update.endswith('\x1b8'), "Курсор сохраняется и восстанавливается"
+    assert f'\x1b[3;{second_x + CELL_WIDTH + 1}H{CROSS_STR:>{CELL_WIDTH}}' in update
+    assert f'\x1b[1;{second_x + 1}HАлиса (1/{NUMBERS_IN_CARD})' in update
+    assert 'Боб' not in update, "Карточка без изменений не перерисовывается"
+
+    renderer.close()
+    assert out.getvalue().endswith('\x1b7\x1b[r\x1b8')
+
+def test_ansi_redraw_on_players_change(players):
+    """
+    Проверяет, что после выбывания игрока перерисовываются только закреплённые строки.
+    """
+    player3 = make_player("Виктор", list(range(31, 46)))
+    out = io.StringIO()
+    # Ширина 60: по 2 карточки в полосе, 3 игрока занимают 2 полосы
+    renderer = CardRenderer(stream=out, ansi=True, size=(60, 40))
+    renderer.render(players + (player3,))
+    size = len(out.getvalue())
+    renderer.render(players)
+    redraw = out.getvalue()[size:]
+    height = 2 * (CARD_ROWS + 1)
+    assert redraw.startswith('\x1b7\x1b[r'), "Экран не сдвигается: закреплённых строк хватает"
+    assert '\x1b[2J' not in redraw
+    assert re.search(r'\x1b\[\d+L', redraw) is None, "Строки не вставляются, экран не сдвигается"
+    assert all(f'\x1b[{i};1H\x1b[2K' in redraw for i in range(1, height + 1)), "Очищаются все закреплённые строки"
+    assert 'Виктор' not in redraw
+    assert redraw.endswith(f'\x1b[{height + 1}r\x1b8')
+
+# Тестирование переноса карточек в полосы по ширине терминала
+def test_ansi_bands(players):
+    """
+    Проверяет, что карточки переносятся в полосы по ширине терминала и адресация учитывает полосу.
+    """
+    player3 = make_player("Виктор", list(range(31, 46)))
+    out = io.StringIO()
+    renderer = CardRenderer(stream=out, ansi=True, size=(80, 40))
+    renderer.render(players + (player3,))
+    frame = renderer.frame(players + (player3,), 80).split('\n')
+    assert len(frame) == 2 * (CARD_ROWS + 1), "2 карточки в первой полосе, 1 во второй"
+    assert all(len(line) <= 80 for line in frame)
+    assert frame[CARD_ROWS + 1].startswith("Виктор")
+
+    size = len(out.getvalue())
+    with patch('builtins.print'):
+        player3.check_move(None, 37)  # строка 1, колонка 1
+    renderer.render(players + (player3,))
+    update = out.getvalue()[size:]
+    band_y = CARD_ROWS + 1
+    assert f'\x1b[{band_y + 1};1HВиктор (1/{NUMBERS_IN_CARD})' in update
+    assert f'\x1b[{band_y + 3};{CELL_WIDTH + 1}H{CROSS_STR:>{CELL_WIDTH}}' in update
+
+@pytest.mark.parametrize('size', [(20, 40), (80, CARD_ROWS + 1)])
+def test_ansi_fallback_when_frame_does_not_fit(players, size):
+    """
+    Проверяет, что кадр, не помещающийся в терминал, выводится целиком без команд курсора.
+    """
+    out = io.StringIO()
+    renderer = CardRenderer(stream=out, ansi=True, size=size)
+    renderer.render(players)
+    renderer.render(players)
+    frame = renderer.frame(players, size[0])
+    assert out.getvalue() == (frame + '\n') * 2
+    assert '\x1b' not in out.getvalue()
+
+def test_ansi_fallback_after_terminal_shrinks(players):
+    """
+    Проверяет, что после уменьшения терминала, в который кадр больше не помещается,
+    выводятся полные кадры, а ограничение прокрутки снимается.
+    """
+    out = io.StringIO()
+    renderer = CardRenderer(stream=out, ansi=True, size=(80, 40))
+    renderer.render(players)
+
+    size = len(out.getvalue())
+    renderer.size = (80, CARD_ROWS + 1)
+    with patch('builtins.print'):
+        players[0].check_move(None, 1)
+    renderer.render(players)
+    update = out.getvalue()[size:]
+    frame = renderer.frame(players, 80)
+    assert update == '\x1b7\x1b[r\x1b8' + frame + '\n', "Без адресации курсора, только полный кадр"
+
+def test_new_card_rebuilds_layout(players):
+    """
+    Проверяет, что новая карточка игрока отрисовывается без зачёркиваний старой.
+    """
+    player1, _ = players
+    renderer = CardRenderer()
+    with patch('builtins.print'):
+        player1.check_move(None, 1)
+        renderer.frame(players)
+        player1.new_card(make_player("Боб", list(range(46, 61))).card)
+    frame = renderer.frame(players).split('\n')
+    assert cell(frame[1], 0, 0) == ' 46'
+    assert CROSS_STR not in frame[1]
+
+def test_ansi_redraw_on_new_card(players):
+    """
+    Проверяет, что в режиме ANSI новая карточка того же игрока перерисовывает кадр целиком,
+    а следующие изменения адресуются по её месту в кадре.
+    """
+    player3 = make_player("Виктор", list(range(31, 46)))
+    table = players + (player3,)
+    out = io.StringIO()
+    renderer = CardRenderer(stream=out, ansi=True, size=(60, 40))
+    renderer.render(table)
+
+    size = len(out.getvalue())
+    player3.new_card(make_player("Виктор", list(range(46, 61))).card)
+    renderer.render(table)
+    redraw = out.getvalue()[size:]
+    height = 2 * (CARD_ROWS + 1)
+    assert f'\x1b[{CARD_ROWS + 3};1H\x1b[2K 46 47 48 49 50' in redraw, "Закреплённый кадр показывает новую карточку"
+    assert redraw.endswith(f'\x1b[{height + 1}r\x1b8')
+
+    size = len(out.getvalue())
+    with patch('builtins.print'):
+        player3.check_move(None, 52)  # строка 1, колонка 1
+    renderer.render(table)
+    update = out.getvalue()[size:]
+    band_y = CARD_ROWS + 1
+    assert f'\x1b[{band_y + 1};1HВиктор (1/{NUMBERS_IN_CARD})' in update
+    assert f'\x1b[{band_y + 3};{CELL_WIDTH + 1}H{CROSS_STR:>{CELL_WIDTH}}' in update
+    assert '\x1b[1;1H' not in update, "Карточка первого игрока не затирается"
+
+def test_layouts_pruned(players):
+    """
+    Проверяет, что отрисовщик не хранит заготовки карточек игроков, которых нет в кадре.
+    """
+    player3 = make_player("Виктор", list(range(31, 46)))
+    renderer = CardRenderer()
+    renderer.frame(players + (player3,))
+    renderer.frame(players)
+    assert set(renderer._layouts) == set(players)
+
+# Тестирование вывода карточек в PlayRound через renderer
+def test_play_round_uses_renderer(players):
+    out = io.StringIO()
+    play_round = PlayRound(*players, renderer=CardRenderer(stream=out, size=(80, 24)))
+    with patch('pandas.DataFrame.to_string') as mocked_to_string:
+        play_round.print_cards()
+    mocked_to_string.assert_not_called()
+    assert out.getvalue() == play_round.renderer.frame(players) + '\n'
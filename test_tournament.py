@@ -0,0 +1,173 @@
+# test_tournament.py
+
+import pytest
+from unittest.mock import patch
+from lotto import Player, PlayRound
+from tournament import Tournament, TableResult, split_tables
+from constants import MIN_PLAYERS, MAX_PLAYERS
+
+
+# Фикстура для создания списка роботов
+@pytest.fixture
+def robots():
+    def make(count):
+        return [Player(name=f"Робот{i}", is_human=False, mistake_rate=0) for i in range(count)]
+    return make
+
+# Тестирование рассадки игроков по столам
+@pytest.mark.parametrize('table_size', range(MIN_PLAYERS, MAX_PLAYERS + 1))
+@pytest.mark.parametrize('count', [2, 3, 5, 6, 7, 11, 24, 1000])
+def test_split_tables_sizes(count, table_size):
+    """
+    Проверяет, что все игроки рассажены и за каждым столом допустимое число игроков.
+    """
+    players = list(range(count))
+    tables = split_tables(players, table_size)
+    seated = sum(tables, [])
+    assert seated == players[:len(seated)], "Каждый игрок должен сидеть не более чем за одним столом"
+    # Без стола может остаться только один игрок и только при столах из MIN_PLAYERS
+    unseated = count - len(seated)
+    assert unseated == (count % MIN_PLAYERS if table_size == MIN_PLAYERS else 0)
+    assert all(MIN_PLAYERS <= len(table) <= table_size for table in tables), "Недопустимый размер стола"
+
+def test_split_tables_too_few_players():
+    with pytest.raises(ValueError):
+        split_tables([1])
+
+# Тестирование проверки параметров турнира
+def test_tournament_invalid_params(robots):
+    with pytest.raises(ValueError):
+        Tournament(robots(1))
+    with pytest.raises(ValueError):
+        Tournament(robots(10), table_size=MAX_PLAYERS + 1)
+    with pytest.raises(ValueError):
+        Tournament(robots(10), executor='fiber')
+    with pytest.raises(ValueError):
+        Tournament(robots(10), draw_replays=-1)
+    with pytest.raises(ValueError):
+        Tournament([Player(name="Боб", is_human=False), Player(name="Боб", is_human=False)])
+
+# Тестирование турнира, где за каждым столом побеждает первый игрок
+def test_tournament_champion(robots):
+    """
+    Проверяет, что турнир из 24 роботов заканчивается одним победителем.
+    """
+    players = robots(24)
+    tournament = Tournament(players)
+
+    def first_wins(play_round):
+        return play_round.players[0]
+
+    with patch.object(PlayRound, 'run_play_round', first_wins), patch('builtins.print'):
+        results = list(tournament.run())
+
+    assert all(isinstance(result, TableResult) for result in results)
+    # 24 игрока: 5 столов первого этапа, затем финал из 5 победителей
+    assert [result.stage for result in results] == [0] * 5 + [1]
+    # Финалисты рассаживаются в порядке завершения столов, поэтому сравниваем с финальным столом
+    assert results[-1].winner is tournament.champion, "Последний стол - финал"
+    assert tournament.champion is results[-1].players[0]
+    assert set(results[-1].players) == {result.winner for result in results[:-1]}
+    assert tournament.standings[tournament.champion.name] == 2
+    # За каждым столом выбывают все, кроме победителя
+    eliminated = sum(len(result.players) - 1 for result in results)
+    assert eliminated == len(players) - 1, "Все, кроме победителя турнира, должны выбыть"
+
+# Тестирование турнира, где все столы заканчиваются ничьей
+def test_tournament_all_draws(robots):
+    """
+    Проверяет, что ничейный стол переигрывается, а затем все его игроки выбывают.
+    """
+    tournament = Tournament(robots(7), draw_replays=2)
+
+    with patch.object(PlayRound, 'run_play_round', return_value=None) as mocked_run, \
+            patch('builtins.print'):
+        results = list(tournament.run())
+
+    assert [result.winner for result in results] == [None, None]
+    assert all(result.replays == 2 for result in results)
+    assert mocked_run.call_count == 2 * 3, "Каждый из 2 столов разыгрывается 3 раза"
+    assert tournament.champion is None
+    assert set(tournament.standings.values()) == {0}
+
+# Тестирование прохода без игры для оставшегося победителя
+def test_tournament_bye(robots):
+    """
+    Проверяет, что единственный нерассаженный победитель проходит этап без игры.
+    """
+    players = robots(12)  # 4 стола -> 4 победителя, при table_size=3 один остаётся без стола
+    tournament = Tournament(players, table_size=3)
+
+    with patch.object(PlayRound, 'run_play_round', lambda play_round: play_round.players[-1]), \
+            patch('builtins.print'):
+        results = list(tournament.run())
+
+    # Этап 1: 4 стола; этап 2: 1 стол и проход; финал из 2 игроков
+    assert sorted(result.stage for result in results) == [0, 0, 0, 0, 1, 2]
+    assert len(results[-1].players) == 2
+    assert tournament.champion is results[-1].winner
+    assert tournament.standings[tournament.champion.name] == 3
+
+# Тестирование турнира со столами из двух игроков
+def test_tournament_pairs_odd_players(robots):
+    """
+    Проверяет, что при столах на двоих и нечётном числе игроков лишний игрок проходит этап без игры.
+    """
+    players = robots(5)
+    tournament = Tournament(players, table_size=MIN_PLAYERS)
+
+    with patch.object(PlayRound, 'run_play_round', lambda play_round: play_round.players[0]), \
+            patch('builtins.print'):
+        results = list(tournament.run())
+
+    assert all(len(result.players) == MIN_PLAYERS for result in results)
+    first_stage = [player for result in results if result.stage == 0 for player in result.players]
+    assert len(first_stage) == 4, "На первом этапе 2 стола по 2 игрока"
+    assert players[-1] not in first_stage, "Последний игрок без стола на первом этапе"
+    assert tournament.standings[players[-1].name] >= 1, "Проход без игры засчитывается как пройденный этап"
+    assert tournament.champion is results[-1].winner
+    assert tournament.champion is not None
+
+# Тестирование повторного запуска турнира
+def test_tournament_rerun_resets_standings(robots):
+    """
+    Проверяет, что повторный запуск начинает турнир с пустой турнирной таблицей.
+    """
+    tournament = Tournament(robots(6))
+
+    with patch.object(PlayRound, 'run_play_round', lambda play_round: play_round.players[0]), \
+            patch('builtins.print'):
+        list(tournament.run())
+        first = dict(tournament.standings)
+        list(tournament.run())
+
+    assert tournament.standings == first, "Очки прошлого турнира не должны накапливаться"
+    assert sum(tournament.standings.values()) == 3, "2 победителя первого этапа и победитель финала"
+
+# Интеграционный тест турнира в пуле процессов
+def test_tournament_process_pool(robots):
+    """
+    Проверяет реальный турнир роботов в пуле процессов: победитель - один из участников.
+    """
+    players = robots(6)
+    tournament = Tournament(players, executor='process', max_workers=2)
+
+    with patch('builtins.print'):
+        champion = tournament.play()
+
+    assert champion in players
+    assert tournament.standings[champion.name] == 2
+
+# Тестирование молчаливых столов роботов
+def test_tournament_robot_tables_quiet(robots):
+    """
+    Проверяет, что столы роботов играются молча и печатаются только итоги столов.
+    """
+    tournament = Tournament(robots(10), max_workers=2)
+
+    with patch('builtins.print') as mocked_print:
+        tournament.play()
+
+    messages = [call.args[0] for call in mocked_print.call_args_list]
+    assert all(message.startswith(('Этап ', 'Победитель турнира', 'Турнир закончился')) for message in messages)
+    assert len(messages) == 3 + 1, "2 стола первого этапа, финал и итог турнира"
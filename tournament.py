@@ -0,0 +1,224 @@
+# tournament.py
+# Турнир по лото на выбывание: игроки рассаживаются за столы, победители проходят дальше
+
+import math
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from lotto import LottoCard, Player, PlayRound
+from constants import MIN_PLAYERS, MAX_PLAYERS, DRAW_REPLAYS
+
+# Итог одного стола: этап, игроки, победитель (None - ничья), число ходов, число переигровок
+TableResult = namedtuple('TableResult', ['stage', 'players', 'winner', 'moves', 'replays'])
+
+
+def split_tables(players, table_size: int = MAX_PLAYERS):
+    """
+    Рассаживает игроков за минимальное число столов примерно поровну.
+
+    Если поровну рассадить нельзя (table_size == MIN_PLAYERS и нечётное число игроков),
+    последний игрок остаётся без стола и в результат не попадает.
+
+    :param players: Список игроков.
+    :param table_size: Максимальное число игроков за столом.
+    :return: Список столов (списков игроков), за каждым от MIN_PLAYERS до table_size игроков.
+    """
+    if len(players) < MIN_PLAYERS:
+        raise ValueError(f"Для турнира необходимо как минимум {MIN_PLAYERS} игрока.")
+    seated = len(players)
+    tables_num = math.ceil(seated / table_size)
+    if seated // tables_num < MIN_PLAYERS:
+        # Столов меньше, зато за каждым не меньше MIN_PLAYERS игроков
+        tables_num = seated // MIN_PLAYERS
+        seated = tables_num * MIN_PLAYERS
+    base, extra = divmod(seated, tables_num)
+    tables, start = [], 0
+    for i in range(tables_num):
+        # Первые extra столов получают на одного игрока больше
+        end = start + base + (1 if i < extra else 0)
+        tables.append(list(players[start:end]))
+        start = end
+    return tables
+
+
+def _play_table(players, quiet):
+    """
+    Разыгрывает один стол. Функция верхнего уровня, чтобы её можно было передать в пул процессов.
+
+    :param players: Игроки за столом.
+    :param quiet: Играть молча, без журнала ходов и карточек.
+    :return: Кортеж из индекса победителя (None при ничьей) и номера последнего хода.
+    """
+    play_round = PlayRound(*players, quiet=quiet)
+    winner = play_round.run_play_round()
+    # Возвращаем индекс, а не объект: в пуле процессов игроки - это копии
+    winner_idx = None if winner is None else players.index(winner)
+    return winner_idx, play_round.move_num
+
+
+class Tournament:
+
+    def __init__(self, players, table_size: int = MAX_PLAYERS, executor: str = 'thread',
+                 max_workers: int = None, draw_replays: int = DRAW_REPLAYS):
+        """
+        Инициализирует турнир.
+
+        :param players: Участники турнира (имена должны быть уникальными).
+        :param table_size: Максимальное число игроков за столом.
+        :param executor: Пул для столов роботов: 'thread' или 'process'.
+        :param max_workers: Число потоков/процессов пула роботов.
+        :param draw_replays: Сколько раз переигрывается стол, закончившийся ничьей.
+        """
+        if len(players) < MIN_PLAYERS:
+            raise ValueError(f"Для турнира необходимо как минимум {MIN_PLAYERS} игрока.")
+        if not (MIN_PLAYERS <= table_size <= MAX_PLAYERS):
+            raise ValueError(f"Размер стола должен быть от {MIN_PLAYERS} до {MAX_PLAYERS}.")
+        if executor not in ('thread', 'process'):
+            raise ValueError("Пул должен быть 'thread' или 'process'.")
+        if draw_replays < 0:
+            raise ValueError("Число переигровок не может быть отрицательным.")
+        if len({player.name for player in players}) != len(players):
+            raise ValueError("Имена игроков должны быть уникальными.")
+        self.players = list(players)
+        self.table_size = table_size
+        self.executor = executor
+        self.max_workers = max_workers
+        self.draw_replays = draw_replays
+        # Турнирная таблица: имя игрока -> число пройденных этапов
+        self.standings = {}
+        self.champion = None
+
+    def run(self):
+        """
+        Проводит турнир, отдавая итоги столов по мере их завершения.
+
+        Столы роботов играются молча и параллельно в пуле потоков или процессов. Столы с людьми
+        играются по одному в отдельном потоке с обычным журналом ходов: консоль у людей одна.
+        Этапы не ждут друг друга: как только у этапа набирается table_size победителей,
+        для них сразу открывается стол следующего этапа. Каждый запуск - новый турнир
+        с пустой турнирной таблицей.
+
+        :return: Генератор объектов TableResult.
+        """
+        pool_class = ProcessPoolExecutor if self.executor == 'process' else ThreadPoolExecutor
+        self._robots_pool = pool_class(max_workers=self.max_workers)
+        self._humans_pool = ThreadPoolExecutor(max_workers=1)
+        self._futures = {}   # future -> (этап, стол, число переигровок)
+        self._waiting = {}   # этап -> победители этапа, ещё не рассаженные за стол
+        self._pending = {}   # этап -> число неразыгранных столов этапа
+        self._advanced = {}  # этап -> общее число победителей этапа
+        self._stage = 0      # Младший незавершённый этап: новых столов в нём уже не будет
+        self._finished = False
+        self.standings = {player.name: 0 for player in self.players}
+        self.champion = None
+        try:
+            tables = split_tables(self.players, self.table_size)
+            for table in tables:
+                self._submit(0, table)
+            # Игрок, которому не хватило стола, проходит первый этап без игры
+            for player in self.players[sum(map(len, tables)):]:
+                self._advance(0, player)
+
+            while self._futures:
+                done, _ = wait(self._futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, table, replays = self._futures.pop(future)
+                    winner_idx, moves = future.result()
+
+                    if winner_idx is None and replays < self.draw_replays:
+                        # Ничья: переигрываем стол с новыми карточками
+                        self._submit(stage, table, replays + 1)
+                        continue
+
+                    winner = None if winner_idx is None else table[winner_idx]
+                    self._pending[stage] -= 1
+                    if winner is not None:
+                        self._advance(stage, winner)
+                    self._close_stages()
+                    yield TableResult(stage, table, winner, moves, replays)
+        finally:
+            self._robots_pool.shutdown(cancel_futures=True)
+            self._humans_pool.shutdown(cancel_futures=True)
+
+    def play(self):
+        """
+        Проводит турнир целиком, печатая итоги столов по мере их завершения.
+
+        :return: Победитель турнира (Player) или None, если все финалисты выбыли.
+        """
+        for result in self.run():
+            names = ', '.join(player.name for player in result.players)
+            if result.winner is None:
+                print(f'Этап {result.stage + 1}, стол ({names}): ничья, все выбывают')
+            else:
+                print(f'Этап {result.stage + 1}, стол ({names}): победил(а) {result.winner.name}')
+        if self.champion is None:
+            print('Турнир закончился без победителя')
+        else:
+            print(f'Победитель турнира: {self.champion.name}!')
+        return self.champion
+
+    def _submit(self, stage, table, replays=0):
+        """
+        Отправляет стол в подходящий пул.
+
+        :param stage: Номер этапа (с нуля).
+        :param table: Игроки за столом.
+        :param replays: Номер переигровки стола.
+        """
+        # Журнал ходов нужен только людям, столы роботов играются молча
+        quiet = not any(player.is_human for player in table)
+        if stage > 0 or replays > 0:
+            # Карточки с прошлого стола уже зачёркнуты
+            for player in table:
+                player.new_card(quiet=quiet)
+        if replays == 0:
+            self._pending[stage] = self._pending.get(stage, 0) + 1
+        pool = self._robots_pool if quiet else self._humans_pool
+        self._futures[pool.submit(_play_table, table, quiet)] = (stage, table, replays)
+
+    def _advance(self, stage, player):
+        """
+        Переводит победителя этапа в следующий этап; при полном столе сразу открывает его.
+
+        :param stage: Этап, который выиграл игрок.
+        :param player: Победитель.
+        """
+        self.standings[player.name] += 1
+        self._advanced[stage] = self._advanced.get(stage, 0) + 1
+        waiting = self._waiting.setdefault(stage, [])
+        waiting.append(player)
+        if len(waiting) == self.table_size:
+            self._submit(stage + 1, waiting.copy())
+            waiting.clear()
+
+    def _close_stages(self):
+        """
+        Завершает этапы, все столы которых разыграны, и рассаживает оставшихся победителей.
+        """
+        while not self._finished and self._pending.get(self._stage, 0) == 0:
+            stage = self._stage
+            waiting = self._waiting.pop(stage, [])
+            advanced = self._advanced.get(stage, 0)
+
+            if advanced == 0:
+                # Все столы этапа закончились ничьей
+                self._finished = True
+            elif advanced == 1:
+                # Единственный победитель этапа - победитель турнира
+                self.champion = waiting[0]
+                self._finished = True
+            elif len(waiting) >= MIN_PLAYERS:
+                self._submit(stage + 1, waiting)
+            elif waiting:
+                # Одному оставшемуся игроку достаётся проход без игры
+                self._advance(stage + 1, waiting[0])
+            self._stage += 1
+
+
+# Пример использования
+if __name__ == "__main__":
+
+    # Турнир из 30 роботов, столы разыгрываются в пуле процессов
+    robots = [Player(name=f"Робот{i}", is_human=False, card=LottoCard(quiet=True)) for i in range(1, 31)]
+    tournament = Tournament(robots, executor='process')
+    tournament.play()